@@ -8,12 +8,12 @@ from openpyxl import Workbook
 def create_sample_excel(output_file: str = 'sample_registration.xlsx'):
     """Create a sample Excel file with test data"""
     
-    # Create workbook
-    wb = Workbook()
-    
-    # Remove default sheet
-    wb.remove(wb.active)
-    
+    # Create workbook in write-only mode: rows are streamed straight to
+    # the output instead of being kept as in-memory Cell objects, so
+    # memory stays O(1) in the number of rows if this script is reused
+    # as a larger template generator
+    wb = Workbook(write_only=True)
+
     # Create Community Info sheet
     ws_community = wb.create_sheet('Community Info')
     
@@ -32,34 +32,15 @@ def create_sample_excel(output_file: str = 'sample_registration.xlsx'):
         'CommunityId'
     ])
     
-    # Sample data
-    ws_community.append([
-        'Sunrise Senior Living',
-        '+1-555-0101',
-        'contact@sunrisesenior.com',
-        '123 Sunrise Boulevard',
-        'San Francisco',
-        'CA',
-        'USA',
-        '94102',
-        150,
-        15,
-        None  # Will be filled after creation
-    ])
-    
-    ws_community.append([
-        'Golden Years Community',
-        '+1-555-0202',
-        'info@goldenyears.com',
-        '456 Golden Lane',
-        'Los Angeles',
-        'CA',
-        'USA',
-        '90001',
-        200,
-        20,
-        None
-    ])
+    # Sample data (CommunityId will be filled after creation)
+    community_rows = [
+        ['Sunrise Senior Living', '+1-555-0101', 'contact@sunrisesenior.com',
+         '123 Sunrise Boulevard', 'San Francisco', 'CA', 'USA', '94102', 150, 15, None],
+        ['Golden Years Community', '+1-555-0202', 'info@goldenyears.com',
+         '456 Golden Lane', 'Los Angeles', 'CA', 'USA', '90001', 200, 20, None],
+    ]
+    for row in community_rows:
+        ws_community.append(row)
     
     # Create Users sheet
     ws_users = wb.create_sheet('Users')
@@ -72,27 +53,14 @@ def create_sample_excel(output_file: str = 'sample_registration.xlsx'):
         'CommunityId'
     ])
     
-    # Sample data
-    ws_users.append([
-        'John',
-        'Doe',
-        'john.doe@sunrisesenior.com',
-        None  # Will be filled after community creation
-    ])
-    
-    ws_users.append([
-        'Jane',
-        'Smith',
-        'jane.smith@sunrisesenior.com',
-        None
-    ])
-    
-    ws_users.append([
-        'Michael',
-        'Johnson',
-        'michael.j@goldenyears.com',
-        None
-    ])
+    # Sample data (CommunityId will be filled after community creation)
+    user_rows = [
+        ['John', 'Doe', 'john.doe@sunrisesenior.com', None],
+        ['Jane', 'Smith', 'jane.smith@sunrisesenior.com', None],
+        ['Michael', 'Johnson', 'michael.j@goldenyears.com', None],
+    ]
+    for row in user_rows:
+        ws_users.append(row)
     
     # Save workbook
     wb.save(output_file)
@@ -3,67 +3,9 @@ Example script for using AWS AppSync GraphQL API with boto3 and gql
 """
 
 import os
-import boto3
-from dotenv import load_dotenv
-from gql import gql, Client
-from gql.transport.requests import RequestsHTTPTransport
-from requests_aws4auth import AWS4Auth
+from gql import gql
 
-# Load environment variables from env.local file
-load_dotenv('env.local')
-
-
-def create_appsync_client(api_url: str = None, region: str = None):
-    """
-    Create an authenticated GraphQL client for AWS AppSync
-    
-    Args:
-        api_url: Your AWS AppSync GraphQL endpoint URL (defaults to env variable)
-        region: AWS region (defaults to env variable or 'us-east-1')
-    
-    Returns:
-        GQL Client instance
-    """
-    # Get configuration from environment variables if not provided
-    if api_url is None:
-        api_url = os.getenv('APPSYNC_API_URL')
-        if not api_url:
-            raise ValueError("APPSYNC_API_URL must be set in env.local or passed as parameter")
-    
-    if region is None:
-        region = os.getenv('AWS_REGION', 'us-east-1')
-    
-    # Get AWS profile if specified
-    aws_profile = os.getenv('AWS_PROFILE')
-    
-    # Get AWS credentials
-    session_kwargs = {}
-    if aws_profile:
-        session_kwargs['profile_name'] = aws_profile
-    
-    credentials = boto3.Session(**session_kwargs).get_credentials()
-    auth = AWS4Auth(
-        credentials.access_key,
-        credentials.secret_key,
-        region,
-        'appsync',
-        session_token=credentials.token,
-    )
-    
-    # Create transport with AWS authentication
-    transport = RequestsHTTPTransport(
-        url=api_url,
-        auth=auth,
-        use_json=True,
-    )
-    
-    # Create GraphQL client
-    client = Client(
-        transport=transport,
-        fetch_schema_from_transport=True,
-    )
-    
-    return client
+from appsync_client import create_appsync_client, ensure_env_loaded as _ensure_env_loaded
 
 
 def example_query():
@@ -127,6 +69,7 @@ def example_mutation():
 
 
 if __name__ == "__main__":
+    _ensure_env_loaded()
     print("AWS GraphQL Environment Setup Complete!")
     print("\nConfiguration loaded from env.local:")
     print(f"  AWS Region: {os.getenv('AWS_REGION', 'us-east-1')}")
@@ -2,135 +2,228 @@
 Process Community Registration Excel file and create communities and caretakers via GraphQL
 """
 
+import argparse
 import os
+import re
 import sys
 import time
+import traceback
 import getpass
 import openpyxl
-from dotenv import load_dotenv
-from gql import gql, Client
-from gql.transport.requests import RequestsHTTPTransport
-from requests_aws4auth import AWS4Auth
+from openpyxl.styles import Font
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from gql import gql, GraphQLRequest
+from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportQueryError
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, List, Optional, Tuple
 
-# Load environment variables from env.local file
-load_dotenv('env.local')
+from appsync_client import create_appsync_client, get_config
 
+# python-calamine is a Rust-backed XLSX reader, typically an order of
+# magnitude faster than openpyxl on the same sheets; fall back to
+# openpyxl when it isn't installed
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
-def create_appsync_client(api_url: str = None, region: str = None, jwt_token: str = None, api_key: str = None):
+# Map Excel column names to GraphQL input field names; built once at
+# import so the readers don't rebuild the dicts per call
+_COMMUNITY_FIELD_MAP = {
+    'Name': 'name',
+    'Contact Phone Number': 'phoneNumber',
+    'Contact Email': 'email',
+    'Street': 'street',
+    'City': 'city',
+    'State': 'state',
+    'Country': 'country',
+    'Zip Code': 'postalCode',
+    'No. Resident': 'residentLimit',
+    'No. Users': 'caretakerLimit',
+}
+
+_CARETAKER_FIELD_MAP = {
+    'First Name': 'firstName',
+    'Last Name': 'lastName',
+    'Email': 'email',
+    'CommunityId': 'communityId',
+}
+
+# Styles are immutable in openpyxl, so one shared Font instance serves
+# every bold header cell
+_BOLD_FONT = Font(bold=True)
+
+# Number of records packed into a single batched GraphQL mutation
+BATCH_SIZE = 25
+
+# Number of worker threads used to submit GraphQL batches concurrently
+MAX_WORKERS = 16
+
+# Section separator built once instead of re-concatenating "=" * 60 at
+# every banner print
+_SEP = "=" * 60
+
+# GraphQL documents are parsed once at import time and reused for every
+# execution, instead of re-running the gql() lexer/parser per record
+_CREATE_COMMUNITY_MUTATION = gql("""
+    mutation CreateCommunity($input: CreateCommunityInput!) {
+        createCommunity(input: $input) {
+            id
+            name
+            street
+            city
+            state
+            country
+            postalCode
+            phoneNumber
+            email
+            residentLimit
+            caretakerLimit
+            isActive
+            createdAt
+            updatedAt
+        }
+    }
+""")
+
+# Idempotency probe: one cheap round trip that lets a re-run skip the
+# admin caretaker create entirely
+_CARETAKER_EXISTS_QUERY = gql("""
+    query CaretakerExists($email: String!, $communityId: String!) {
+        caretakerExists(email: $email, communityId: $communityId) {
+            exists
+            caretaker {
+                id
+            }
+        }
+    }
+""")
+
+# Minimal readiness probe used while waiting for a freshly created
+# community to become readable
+_GET_COMMUNITY_ID_QUERY = gql("""
+    query GetCommunity($id: ID!) {
+        getCommunity(id: $id) {
+            id
+        }
+    }
+""")
+
+_GET_USER_BY_EMAIL_QUERY = gql("""
+    query GetUserByEmail($email: String!, $role: String!) {
+        getUserByEmail(email: $email, role: $role) {
+            id
+            email
+            firstName
+            lastName
+            communityId
+            role
+            isActive
+        }
+    }
+""")
+
+_CREATE_COMMUNITY_CARETAKER_MUTATION = gql("""
+    mutation CreateCommunityCaretaker($input: CreateCaretakerInput!) {
+        createCommunityCaretaker(input: $input) {
+            id
+            communityId
+            firstName
+            lastName
+            email
+            role
+            isActive
+            createdAt
+            updatedAt
+        }
+    }
+""")
+
+
+def _execute(client: SyncClientSession, request: GraphQLRequest, variables: Optional[Dict] = None) -> Dict:
     """
-    Create an authenticated GraphQL client for AWS AppSync
-    
-    Supports multiple authentication methods (in priority order):
-    1. Cognito JWT token authentication - if jwt_token is provided
-    2. API Key authentication - if APPSYNC_API_KEY is provided
-    3. IAM authentication (default) - uses AWS credentials
-    
+    Execute a cached GraphQL document with per-call variables
+
+    gql 4.x binds variable_values onto the request object itself before
+    the transport serializes it, so handing the module-level (or
+    lru_cache'd) documents straight to client.execute would let
+    concurrent threads overwrite each other's variables. Wrapping the
+    shared document in a fresh GraphQLRequest per call keeps the parsed
+    AST reused while the mutable variable binding stays call-local.
+
     Args:
-        api_url: Your AWS AppSync GraphQL endpoint URL (defaults to env variable)
-        region: AWS region (defaults to env variable or 'us-east-1')
-        jwt_token: Optional JWT token from Cognito User Pool authentication
-        api_key: Optional API key for AppSync API Key authentication
-    
+        client: GraphQL client
+        request: Parsed module-level document
+        variables: Variable values for this execution
+
     Returns:
-        GQL Client instance
+        Execution result dictionary
     """
-    # Get configuration from environment variables if not provided
-    if api_url is None:
-        api_url = os.getenv('APPSYNC_API_URL')
-        if not api_url:
-            raise ValueError("APPSYNC_API_URL must be set in env.local or passed as parameter")
-    
-    if region is None:
-        region = os.getenv('AWS_REGION', 'us-east-1')
-    
-    # Priority 1: Use JWT token authentication (Cognito User Pool)
-    if jwt_token:
-        headers = {
-            'Authorization': jwt_token
-        }
-        transport = RequestsHTTPTransport(
-            url=api_url,
-            headers=headers,
-            use_json=True,
-        )
-    # Priority 2: Check for API Key authentication
-    elif api_key or os.getenv('APPSYNC_API_KEY'):
-        api_key = api_key or os.getenv('APPSYNC_API_KEY')
-        headers = {
-            'x-api-key': api_key
-        }
-        transport = RequestsHTTPTransport(
-            url=api_url,
-            headers=headers,
-            use_json=True,
-        )
-    # Priority 3: Use IAM authentication (AWS Signature Version 4)
-    else:
-        aws_profile = os.getenv('AWS_PROFILE')
-        
-        # Get AWS credentials
-        session_kwargs = {}
-        if aws_profile:
-            session_kwargs['profile_name'] = aws_profile
-        
-        credentials = boto3.Session(**session_kwargs).get_credentials()
-        if not credentials:
-            raise ValueError("AWS credentials not found. Please configure AWS credentials, set APPSYNC_API_KEY, or use Cognito JWT authentication.")
-        
-        auth = AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
-            region,
-            'appsync',
-            session_token=credentials.token,
-        )
-        
-        # Create transport with AWS authentication
-        transport = RequestsHTTPTransport(
-            url=api_url,
-            auth=auth,
-            use_json=True,
-        )
-    
-    # Create GraphQL client
-    # Disable schema fetching since we have the schema defined in code
-    # Some AppSync APIs don't support full introspection queries
-    client = Client(
-        transport=transport,
-        fetch_schema_from_transport=False,
+    return client.execute(GraphQLRequest(request.document, variable_values=variables))
+
+
+@lru_cache(maxsize=None)
+def _get_session(profile_name: Optional[str]) -> boto3.Session:
+    """
+    Build and cache a boto3 Session per profile
+
+    Session construction reloads AWS config files and triggers
+    credential resolution, which can take hundreds of milliseconds;
+    caching makes that a one-time cost per process.
+    """
+    if profile_name:
+        return boto3.Session(profile_name=profile_name)
+    return boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _get_cognito_client(region: str, profile_name: Optional[str]):
+    """Build and cache a Cognito client (and its SSL pool) per region/profile"""
+    # Pool sized to match the thread-pool fan-out; adaptive retries back
+    # off automatically if Cognito throttles the concurrent admin calls
+    config = Config(
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        max_pool_connections=32,
+        tcp_keepalive=True,
     )
-    
-    return client
+    return _get_session(profile_name).client('cognito-idp', region_name=region, config=config)
+
+
+def _warm_aws_credentials() -> None:
+    """
+    Resolve AWS credentials eagerly on the calling thread
+
+    Worker threads would otherwise each race the credential-provider
+    chain (IMDS, SSO, credential_process) on their first signed call,
+    which can stall for seconds per thread; resolving once up front
+    lets the whole pool share the warm credential cache.
+    """
+    credentials = _get_session(get_config('AWS_PROFILE')).get_credentials()
+    if credentials is not None:
+        credentials.get_frozen_credentials()
 
 
 def create_cognito_client(region: str = None):
     """
     Create a Cognito Identity Provider client
-    
+
     Args:
         region: AWS region (defaults to env variable or 'us-east-1')
-    
+
     Returns:
-        boto3 Cognito Identity Provider client
+        boto3 Cognito Identity Provider client (cached per region/profile)
     """
     if region is None:
-        region = os.getenv('AWS_REGION', 'us-east-1')
-    
+        region = get_config('AWS_REGION', 'us-east-1')
+
     # Get AWS profile if specified
-    aws_profile = os.getenv('AWS_PROFILE')
-    
-    # Create session with profile if specified
-    session_kwargs = {}
-    if aws_profile:
-        session_kwargs['profile_name'] = aws_profile
-    
-    session = boto3.Session(**session_kwargs)
-    cognito_client = session.client('cognito-idp', region_name=region)
-    
-    return cognito_client
+    aws_profile = get_config('AWS_PROFILE')
+
+    return _get_cognito_client(region, aws_profile)
 
 
 def authenticate_cognito_user(user_pool_id: str, client_id: str, username: str, password: str, region: str = None) -> str:
@@ -151,8 +244,8 @@ def authenticate_cognito_user(user_pool_id: str, client_id: str, username: str,
         Exception: If authentication fails
     """
     if region is None:
-        region = os.getenv('AWS_REGION', 'us-east-1')
-    
+        region = get_config('AWS_REGION', 'us-east-1')
+
     cognito_idp_client = create_cognito_client(region)
     
     try:
@@ -217,19 +310,21 @@ def authenticate_cognito_user(user_pool_id: str, client_id: str, username: str,
         raise Exception(f"Authentication error: {str(e)}")
 
 
-def get_or_create_cognito_group(cognito_client, user_pool_id: str, community_id: str, community_name: str) -> str:
+@lru_cache(maxsize=None)
+def _ensure_cognito_group(user_pool_id: str, community_id: str, community_name: str) -> str:
     """
-    Get or create a Cognito group for a community
-    
+    Ensure the Cognito group for a community exists (memoized per run)
+
     Args:
-        cognito_client: boto3 Cognito client
         user_pool_id: Cognito User Pool ID
         community_id: Community ID
         community_name: Community name
-    
+
     Returns:
         Group name
     """
+    cognito_client = create_cognito_client()
+
     # Create group name from community ID (sanitize for Cognito group name requirements)
     # Cognito group names can contain letters, numbers, spaces, and these characters: + = . , - @ _
     group_name = f"community-{community_id}"
@@ -261,11 +356,103 @@ def get_or_create_cognito_group(cognito_client, user_pool_id: str, community_id:
     except Exception as e:
         print(f"  ⚠ Warning: Error checking Cognito group '{group_name}': {str(e)}")
         raise
-    
+
     return group_name
 
 
-def add_user_to_cognito(cognito_client, user_pool_id: str, email: str, first_name: str, last_name: str, group_name: str) -> bool:
+def get_or_create_cognito_group(cognito_client, user_pool_id: str, community_id: str, community_name: str) -> str:
+    """
+    Get or create a Cognito group for a community
+
+    The existence check is memoized per (pool, community) for the run,
+    so repeat calls for the same community cost no Cognito round trip.
+    The cognito_client argument is kept for call-site compatibility;
+    the memoized helper uses the cached client internally.
+
+    Args:
+        cognito_client: boto3 Cognito client
+        user_pool_id: Cognito User Pool ID
+        community_id: Community ID
+        community_name: Community name
+
+    Returns:
+        Group name
+    """
+    return _ensure_cognito_group(user_pool_id, community_id, community_name)
+
+
+def prefetch_existing_users(cognito_client, user_pool_id: str) -> set:
+    """
+    Fetch the emails of all users already in the Cognito User Pool
+
+    One paginated list_users call per 60 users replaces the
+    per-user "try create, catch UsernameExistsException" round trip
+    on re-runs.
+
+    Args:
+        cognito_client: boto3 Cognito client
+        user_pool_id: Cognito User Pool ID
+
+    Returns:
+        Set of lowercased email addresses present in the pool
+    """
+    existing = set()
+    paginator = cognito_client.get_paginator('list_users')
+    for page in paginator.paginate(UserPoolId=user_pool_id, AttributesToGet=['email']):
+        for user in page['Users']:
+            for attribute in user['Attributes']:
+                if attribute['Name'] == 'email' and attribute['Value']:
+                    existing.add(attribute['Value'].lower())
+    return existing
+
+
+def _update_existing_cognito_user(cognito_client, user_pool_id: str, email: str, first_name: str, last_name: str, group_name: str) -> bool:
+    """
+    Update an existing Cognito user's attributes and add them to a group
+
+    Args:
+        cognito_client: boto3 Cognito client
+        user_pool_id: Cognito User Pool ID
+        email: User email address (used as username)
+        first_name: User first name
+        last_name: User last name
+        group_name: Cognito group name to assign user to
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        # Update user attributes (keep email_verified as false - user must verify)
+        cognito_client.admin_update_user_attributes(
+            UserPoolId=user_pool_id,
+            Username=email,
+            UserAttributes=[
+                {'Name': 'email_verified', 'Value': 'false'},  # User must verify email
+                {'Name': 'given_name', 'Value': first_name},
+                {'Name': 'family_name', 'Value': last_name},
+            ]
+        )
+
+        # Add user to group
+        cognito_client.admin_add_user_to_group(
+            UserPoolId=user_pool_id,
+            Username=email,
+            GroupName=group_name
+        )
+
+        print(f"  ✓ User already exists in Cognito, updated and added to group '{group_name}'")
+        return True
+    except ClientError as update_error:
+        update_error_code = update_error.response.get('Error', {}).get('Code', '')
+        update_error_message = update_error.response.get('Error', {}).get('Message', '')
+        print(f"  ✗ Error updating existing user: {update_error_code} - {update_error_message}")
+        return False
+    except Exception as e:
+        print(f"  ✗ Error updating existing user: {str(e)}")
+        return False
+
+
+def add_user_to_cognito(cognito_client, user_pool_id: str, email: str, first_name: str, last_name: str, group_name: str, existing_users: Optional[set] = None) -> bool:
     """
     Add a user to Cognito User Pool and assign to a group
     Cognito will automatically send temporary password and invitation email
@@ -278,10 +465,20 @@ def add_user_to_cognito(cognito_client, user_pool_id: str, email: str, first_nam
         first_name: User first name
         last_name: User last name
         group_name: Cognito group name to assign user to
-    
+        existing_users: Optional prefetched set of lowercased emails already
+            in the pool (from prefetch_existing_users); skips the doomed
+            create call for users known to exist
+
     Returns:
         True if successful, False otherwise
     """
+    # If a prefetched user listing says this user already exists, go
+    # straight to the update path and skip the admin_create_user call
+    # that would only fail with UsernameExistsException
+    if existing_users is not None and email.lower() in existing_users:
+        print(f"  User already exists in Cognito, updating and adding to group...")
+        return _update_existing_cognito_user(cognito_client, user_pool_id, email, first_name, last_name, group_name)
+
     try:
         # Create user in Cognito using email as username
         # MessageAction='WELCOME' sends invitation email with temp password
@@ -318,45 +515,19 @@ def add_user_to_cognito(cognito_client, user_pool_id: str, email: str, first_nam
         
         if error_code == 'UsernameExistsException':
             # User already exists, update attributes and add to group
-            try:
-                print(f"  User already exists in Cognito, updating and adding to group...")
-                # Update user attributes (keep email_verified as false - user must verify)
-                cognito_client.admin_update_user_attributes(
-                    UserPoolId=user_pool_id,
-                    Username=email,
-                    UserAttributes=[
-                        {'Name': 'email_verified', 'Value': 'false'},  # User must verify email
-                        {'Name': 'given_name', 'Value': first_name},
-                        {'Name': 'family_name', 'Value': last_name},
-                    ]
-                )
-                
-                # Add user to group
-                cognito_client.admin_add_user_to_group(
-                    UserPoolId=user_pool_id,
-                    Username=email,
-                    GroupName=group_name
-                )
-                
-                print(f"  ✓ User already exists in Cognito, updated and added to group '{group_name}'")
-                return True
-            except ClientError as update_error:
-                update_error_code = update_error.response.get('Error', {}).get('Code', '')
-                update_error_message = update_error.response.get('Error', {}).get('Message', '')
-                print(f"  ✗ Error updating existing user: {update_error_code} - {update_error_message}")
-                return False
-            except Exception as e:
-                print(f"  ✗ Error updating existing user: {str(e)}")
-                return False
+            print(f"  User already exists in Cognito, updating and adding to group...")
+            return _update_existing_cognito_user(cognito_client, user_pool_id, email, first_name, last_name, group_name)
         else:
             # Other ClientError - show detailed error
             print(f"  ✗ Cognito API Error: {error_code}")
             print(f"  Error message: {error_message}")
             return False
     except Exception as e:
-        print(f"  ✗ Unexpected error adding user to Cognito: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        # No traceback formatting here: this path runs inside the
+        # enrollment thread pool, and print_exc's frame walking plus
+        # multi-line stderr I/O would serialize the workers during an
+        # error storm. The exception type keeps the line diagnosable.
+        print(f"  ✗ Unexpected error adding user to Cognito: {type(e).__name__}: {str(e)}")
         return False
 
 
@@ -466,53 +637,45 @@ def add_verified_user_to_cognito(cognito_client, user_pool_id: str, email: str,
         return False
 
 
-def read_community_data(file_path: str) -> List[Dict]:
+def _communities_from_rows(headers: Tuple, rows) -> List[Dict]:
     """
-    Read community data from Excel file
-    
+    Map raw 'Community Info' rows to community data dictionaries
+
     Args:
-        file_path: Path to the Excel file
-    
+        headers: Header row values
+        rows: Iterable of data row value tuples
+
     Returns:
         List of community data dictionaries
     """
-    wb = openpyxl.load_workbook(file_path)
-    ws = wb['Community Info']
-    
     communities = []
-    headers = [cell.value for cell in ws[1]]
-    
-    # Map Excel column names to GraphQL input field names
-    field_mapping = {
-        'Name': 'name',
-        'Contact Phone Number': 'phoneNumber',
-        'Contact Email': 'email',
-        'Street': 'street',
-        'City': 'city',
-        'State': 'state',
-        'Country': 'country',
-        'Zip Code': 'postalCode',
-        'No. Resident': 'residentLimit',
-        'No. Users': 'caretakerLimit',
-    }
-    
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        # Skip empty rows
-        if not any(row):
+
+    # Resolve header positions once so the per-row loop touches only the
+    # mapped columns with no dict lookups
+    field_mapping = _COMMUNITY_FIELD_MAP
+    col_plan = [
+        (idx, field_mapping[header], field_mapping[header] in ('residentLimit', 'caretakerLimit'))
+        for idx, header in enumerate(headers)
+        if header in field_mapping
+    ]
+    required_idx = [idx for idx, field_name, _ in col_plan
+                    if field_name in ('name', 'phoneNumber', 'email')]
+
+    for row in rows:
+        # Skip empty rows: a row without any required column is dropped
+        # below anyway, so examine at most those cells instead of
+        # running any() across the full row
+        if all(row[idx] is None for idx in required_idx):
             continue
-        
+
         community = {}
-        for idx, header in enumerate(headers):
-            if header in field_mapping and row[idx] is not None:
-                field_name = field_mapping[header]
-                value = row[idx]
-                
-                # Convert numeric fields to int
-                if field_name in ['residentLimit', 'caretakerLimit']:
-                    value = int(value)
-                
-                community[field_name] = value
-        
+        for idx, field_name, is_int in col_plan:
+            value = row[idx]
+            if value is None:
+                continue
+            # Convert numeric fields to int
+            community[field_name] = int(value) if is_int else value
+
         # Only add if required fields are present
         if community.get('name') and community.get('phoneNumber') and community.get('email'):
             # Set defaults for required fields if not provided
@@ -520,109 +683,422 @@ def read_community_data(file_path: str) -> List[Dict]:
                 community['residentLimit'] = 100
             if 'caretakerLimit' not in community:
                 community['caretakerLimit'] = 10
-            
+
             communities.append(community)
-    
+
     return communities
 
 
-def read_caretaker_data(file_path: str) -> List[Dict]:
+def _caretakers_from_rows(headers: Tuple, rows) -> List[Dict]:
     """
-    Read caretaker data from Excel file
-    
+    Map raw 'Users' rows to caretaker data dictionaries
+
     Args:
-        file_path: Path to the Excel file
-    
+        headers: Header row values
+        rows: Iterable of data row value tuples
+
     Returns:
         List of caretaker data dictionaries
     """
-    wb = openpyxl.load_workbook(file_path)
-    ws = wb['Users']
-    
     caretakers = []
-    headers = [cell.value for cell in ws[1]]
-    
-    # Map Excel column names to GraphQL input field names
-    field_mapping = {
-        'First Name': 'firstName',
-        'Last Name': 'lastName',
-        'Email': 'email',
-        'CommunityId': 'communityId',
-    }
-    
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        # Skip empty rows
-        if not any(row):
+
+    # Resolve header positions once so the per-row loop touches only the
+    # mapped columns with no dict lookups
+    field_mapping = _CARETAKER_FIELD_MAP
+    col_plan = [
+        (idx, field_mapping[header])
+        for idx, header in enumerate(headers)
+        if header in field_mapping
+    ]
+    required_idx = [idx for idx, field_name in col_plan
+                    if field_name in ('firstName', 'lastName', 'email')]
+
+    for row in rows:
+        # Skip empty rows: a row without any required column is dropped
+        # below anyway, so examine at most those cells instead of
+        # running any() across the full row
+        if all(row[idx] is None for idx in required_idx):
             continue
-        
+
         caretaker = {}
-        for idx, header in enumerate(headers):
-            if header in field_mapping and row[idx] is not None:
-                field_name = field_mapping[header]
-                caretaker[field_name] = row[idx]
-        
+        for idx, field_name in col_plan:
+            value = row[idx]
+            if value is not None:
+                caretaker[field_name] = value
+
         # Only add if required fields are present
-        if (caretaker.get('firstName') and 
-            caretaker.get('lastName') and 
+        if (caretaker.get('firstName') and
+            caretaker.get('lastName') and
             caretaker.get('email')):
             caretakers.append(caretaker)
-    
+
     return caretakers
 
 
-def update_excel_with_community_id(file_path: str, community_id: str) -> None:
+def _calamine_sheet_rows(wb, sheet_name: str) -> Tuple[Tuple, List[Tuple]]:
+    """
+    Extract (headers, rows) from a calamine sheet
+
+    Normalizes calamine's conventions to the ones the row mappers expect
+    from openpyxl: empty cells become None instead of '', and rows are
+    padded to header width (calamine trims trailing empty cells).
+
+    Args:
+        wb: CalamineWorkbook instance
+        sheet_name: Name of the sheet to read
+
+    Returns:
+        Tuple of (header row values, list of data row value tuples)
+    """
+    rows = wb.get_sheet_by_name(sheet_name).to_python()
+    if not rows:
+        return (), []
+
+    headers = tuple(rows[0])
+    width = len(headers)
+
+    normalized = []
+    for row in rows[1:]:
+        values = [None if value == '' else value for value in row]
+        if len(values) < width:
+            values.extend([None] * (width - len(values)))
+        normalized.append(tuple(values))
+
+    return headers, normalized
+
+
+def read_workbook(file_path: str) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Read community and caretaker data from the Excel file in one pass
+
+    Uses python-calamine (Rust parser) when available; otherwise loads
+    the workbook once with openpyxl in read-only streaming mode (the full
+    XLSX zip inflate + XML parse is the dominant startup cost, and the
+    default loader additionally materializes a Cell object per cell) and
+    iterates both sheets from the same parsed workbook.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        Tuple of (communities, caretakers) data dictionaries
+    """
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(file_path)
+        communities = _communities_from_rows(*_calamine_sheet_rows(wb, 'Community Info'))
+        caretakers = _caretakers_from_rows(*_calamine_sheet_rows(wb, 'Users'))
+        return communities, caretakers
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        # Read-only worksheets don't support ws[1] random access; take the
+        # header row from the streaming iterator instead
+        ws_community = wb['Community Info']
+        ws_users = wb['Users']
+
+        # Some writers emit broken dimension metadata ("A1:A1"); force
+        # openpyxl to rescan so iter_rows sees the real extent. Unsized
+        # sheets raise ValueError and already scan in full, so they need
+        # no reset.
+        for ws in (ws_community, ws_users):
+            try:
+                if ws.calculate_dimension() == 'A1:A1':
+                    ws.reset_dimensions()
+            except ValueError:
+                pass
+
+        # Unsized sheets yield ragged rows (each row stops at its last
+        # populated cell), so pad to header width for the row mappers
+        def padded_rows(ws, width):
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if len(row) < width:
+                    row = row + (None,) * (width - len(row))
+                yield row
+
+        # An empty sheet has no header row to take; return no records
+        # and let the "No valid community found" guard report it, the
+        # same way the calamine path handles it
+        headers = next(ws_community.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        communities = _communities_from_rows(headers, padded_rows(ws_community, len(headers))) if headers else []
+
+        headers = next(ws_users.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        caretakers = _caretakers_from_rows(headers, padded_rows(ws_users, len(headers))) if headers else []
+    finally:
+        # Release the underlying zipfile handle
+        wb.close()
+
+    return communities, caretakers
+
+
+def _admin_email_for_community(community_name: str) -> str:
+    """
+    Derive the community admin email from the community name
+
+    Sanitizes the name (lowercased alphanumerics only, with a fallback
+    when nothing survives) and appends the foresightcares.com domain.
+
+    Args:
+        community_name: Community display name
+
+    Returns:
+        Admin email address in the form <sanitizedname>@foresightcares.com
+    """
+    # filter() drives the scan at C level (str.isalnum is an unbound
+    # slot method) instead of a per-character Python generator, and the
+    # lowercase pass runs once on the surviving characters
+    sanitized_name = ''.join(filter(str.isalnum, community_name)).lower()
+    if not sanitized_name:
+        sanitized_name = 'community'  # Fallback if name has no alphanumeric chars
+    return f"{sanitized_name}@foresightcares.com"
+
+
+class RegistrationContext:
+    """
+    Shared, precomputed state for one registration run
+
+    Built once at the start of processing so the guard checks and the
+    admin-user phase reuse the same normalized email collections
+    instead of each re-walking the input lists and re-deriving the
+    admin address.
+    """
+
+    def __init__(self, communities: List[Dict], caretakers: List[Dict]):
+        self.communities = communities
+        self.caretakers = caretakers
+        self.caretaker_emails = [c['email'] for c in caretakers if c.get('email')]
+        self.community_name = communities[0].get('name', 'Community') if communities else 'Community'
+        self.community_admin_email = _admin_email_for_community(self.community_name) if communities else None
+
+    def emails_to_check(self) -> List[str]:
+        """All emails whose prior existence in Cognito should block the run"""
+        emails = list(self.caretaker_emails)
+        if self.community_admin_email:
+            emails.append(self.community_admin_email)
+        return emails
+
+
+class RegistrationWorkbook:
+    """
+    Single-load wrapper around the registration Excel file
+
+    Parses the read sheets once (lazily, through read_workbook) and
+    shares the result between both accessors, instead of re-inflating
+    and re-parsing the XLSX for every operation. Mutations reopen the
+    file writable only when actually required. Usable as a context
+    manager.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._data = None
+        self._wb = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Release the writable workbook, if one was loaded"""
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    def _writable_workbook(self):
+        """
+        Load the workbook writable once and reuse it for all mutations
+
+        Each load_workbook call re-reads the zip and re-parses every
+        sheet's XML; caching the object means the CommunityId stamp and
+        the admin-credentials sheet share one parse.
+        """
+        if self._wb is None:
+            self._wb = openpyxl.load_workbook(self.file_path)
+        return self._wb
+
+    def _load(self) -> Tuple[List[Dict], List[Dict]]:
+        if self._data is None:
+            self._data = read_workbook(self.file_path)
+        return self._data
+
+    def get_communities(self) -> List[Dict]:
+        """Return community data from the 'Community Info' sheet"""
+        return self._load()[0]
+
+    def get_caretakers(self) -> List[Dict]:
+        """Return caretaker data from the 'Users' sheet"""
+        return self._load()[1]
+
+    def set_community_id(self, community_id: str, verbose: bool = False) -> None:
+        """
+        Write the community ID into the Users sheet
+
+        Args:
+            community_id: The community ID to write
+            verbose: If True, report rows whose existing value was replaced
+                (costs one extra cell read per row)
+        """
+        try:
+            wb = self._writable_workbook()
+            ws = wb['Users']
+
+            # Find the CommunityId column index
+            headers = [cell.value for cell in ws[1]]
+            community_id_col_idx = None
+
+            for idx, header in enumerate(headers):
+                if header == 'CommunityId':
+                    community_id_col_idx = idx + 1  # openpyxl uses 1-based indexing
+                    break
+
+            # If CommunityId column doesn't exist, create it
+            if community_id_col_idx is None:
+                # Add CommunityId header at the end
+                max_col = ws.max_column
+                ws.cell(row=1, column=max_col + 1, value='CommunityId')
+                community_id_col_idx = max_col + 1
+
+            # Find First Name column index (to check if row has data)
+            first_name_col = None
+            for idx, header in enumerate(headers):
+                if header == 'First Name':
+                    first_name_col = idx + 1
+                    break
+
+            if first_name_col:
+                # Snapshot the first-name column in one values-only pass,
+                # then write the ID in a tight loop; the old value is only
+                # read back when verbose asks for the diff report
+                first_name_values = [
+                    row[0] for row in ws.iter_rows(
+                        min_row=2, min_col=first_name_col, max_col=first_name_col, values_only=True
+                    )
+                ]
+                column_slice = ws.iter_rows(
+                    min_row=2, max_row=1 + len(first_name_values),
+                    min_col=community_id_col_idx, max_col=community_id_col_idx,
+                )
+                for first_name, (cell,) in zip(first_name_values, column_slice):
+                    # Only update rows that have data (check if first name exists)
+                    if not first_name:
+                        continue
+                    if verbose:
+                        old_value = cell.value
+                        if old_value and str(old_value) != str(community_id):
+                            print(f"    Updated row {cell.row}: '{old_value}' → '{community_id}'")
+                    cell.value = community_id
+
+            # Save the workbook
+            wb.save(self.file_path)
+            print(f"  ✓ Updated Excel file with CommunityId: {community_id}")
+
+        except Exception as e:
+            print(f"  ⚠ Warning: Could not update Excel file with CommunityId: {str(e)}")
+
+    def add_admin_credentials(self, admin_email: str, admin_password: str) -> None:
+        """
+        Add a sheet to the Excel file with admin username (email) and password
+
+        Args:
+            admin_email: Admin user email address
+            admin_password: Admin user password
+        """
+        try:
+            wb = self._writable_workbook()
+
+            # Remove existing Admin Credentials sheet if it exists
+            if 'Admin Credentials' in wb.sheetnames:
+                wb.remove(wb['Admin Credentials'])
+
+            # Create new sheet, appending whole rows instead of
+            # addressing each cell individually
+            ws = wb.create_sheet('Admin Credentials')
+            ws.append(('Username (Email)', 'Password'))
+            ws.append((admin_email, admin_password))
+
+            # Make headers bold (optional formatting)
+            ws.cell(row=1, column=1).font = _BOLD_FONT
+            ws.cell(row=1, column=2).font = _BOLD_FONT
+
+            # Auto-adjust column widths
+            ws.column_dimensions['A'].width = max(len('Username (Email)'), len(admin_email)) + 2
+            ws.column_dimensions['B'].width = max(len('Password'), len(admin_password)) + 2
+
+            wb.save(self.file_path)
+            print(f"  ✓ Added admin credentials to Excel file (sheet: 'Admin Credentials')")
+        except Exception as e:
+            print(f"  ✗ Error adding admin credentials to Excel file: {str(e)}")
+            raise
+
+
+# Per-run memo of resolved email -> community id lookups; retries and
+# repeat checks reuse it instead of re-walking the listing over the
+# wire. Process-lifetime only by design: a disk cache could serve stale
+# data to what is a duplicate-prevention guard.
+_communities_by_email: Dict[str, Optional[str]] = {}
+
+# The schema has no server-side email filter for communities, so the
+# lookup pages through listAllCommunities with a selection trimmed to
+# the two fields actually compared, stopping at the first match
+_LIST_COMMUNITIES_QUERY = gql("""
+    query ListCommunities($limit: Int, $nextToken: String) {
+        listAllCommunities(limit: $limit, nextToken: $nextToken) {
+            items {
+                id
+                email
+            }
+            nextToken
+        }
+    }
+""")
+
+
+def _find_community_id_by_email(client: SyncClientSession, community_email: str) -> Optional[str]:
     """
-    Update the Excel file with the community ID in the Users sheet
-    
+    Find a community's ID by email (memoized per run)
+
+    Pages through listAllCommunities and returns as soon as the email
+    is seen, instead of pulling the full listing into memory.
+
     Args:
-        file_path: Path to the Excel file
-        community_id: The community ID to write
+        client: GraphQL client
+        community_email: Community email to look up
+
+    Returns:
+        Community ID, or None if no community has this email
     """
-    try:
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb['Users']
-        
-        # Find the CommunityId column index
-        headers = [cell.value for cell in ws[1]]
-        community_id_col_idx = None
-        
-        for idx, header in enumerate(headers):
-            if header == 'CommunityId':
-                community_id_col_idx = idx + 1  # openpyxl uses 1-based indexing
-                break
-        
-        # If CommunityId column doesn't exist, create it
-        if community_id_col_idx is None:
-            # Add CommunityId header at the end
-            max_col = ws.max_column
-            ws.cell(row=1, column=max_col + 1, value='CommunityId')
-            community_id_col_idx = max_col + 1
-        
-        # Find First Name column index (to check if row has data)
-        first_name_col = None
-        for idx, header in enumerate(headers):
-            if header == 'First Name':
-                first_name_col = idx + 1
+    key = community_email.lower()
+    if key in _communities_by_email:
+        return _communities_by_email[key]
+
+    found = None
+    next_token = None
+    while True:
+        variables = {"limit": 200}
+        if next_token:
+            variables["nextToken"] = next_token
+        result = _execute(client, _LIST_COMMUNITIES_QUERY, variables)
+        connection = result.get('listAllCommunities', {})
+
+        for community in connection.get('items', []):
+            email = community.get('email')
+            if email and email.lower() == key:
+                found = community.get('id')
                 break
-        
-        # Update all rows with the community ID (overwrite any existing values)
-        for row_idx in range(2, ws.max_row + 1):
-            # Only update rows that have data (check if first name exists)
-            if first_name_col and ws.cell(row=row_idx, column=first_name_col).value:
-                old_value = ws.cell(row=row_idx, column=community_id_col_idx).value
-                ws.cell(row=row_idx, column=community_id_col_idx, value=community_id)
-                if old_value and str(old_value) != str(community_id):
-                    print(f"    Updated row {row_idx}: '{old_value}' → '{community_id}'")
-        
-        # Save the workbook
-        wb.save(file_path)
-        print(f"  ✓ Updated Excel file with CommunityId: {community_id}")
-        
-    except Exception as e:
-        print(f"  ⚠ Warning: Could not update Excel file with CommunityId: {str(e)}")
+        if found is not None:
+            break
+
+        next_token = connection.get('nextToken')
+        if not next_token:
+            break
+
+    _communities_by_email[key] = found
+    return found
 
 
-def check_community_group_exists(client: Client, cognito_client, user_pool_id: str, community_email: str, community_name: str) -> Tuple[bool, str]:
+def check_community_group_exists(client: SyncClientSession, cognito_client, user_pool_id: str, community_email: str, community_name: str) -> Tuple[bool, str]:
     """
     Check if a community group already exists in Cognito by:
     1. Querying GraphQL to see if a community with the same email exists
@@ -638,46 +1114,29 @@ def check_community_group_exists(client: Client, cognito_client, user_pool_id: s
     Returns:
         Tuple of (group_exists: bool, group_name: str)
     """
+    community_id = None
     try:
-        # First, try to find if a community with this email exists via GraphQL
-        # Query all communities and check for matching email
-        query = gql("""
-            query ListCommunities($limit: Int) {
-                listAllCommunities(limit: $limit) {
-                    items {
-                        id
-                        name
-                        email
-                    }
-                }
-            }
-        """)
-        
+        # First, try to find if a community with this email exists via
+        # GraphQL; resolved lookups are memoized for the run
         try:
-            result = client.execute(query, variable_values={"limit": 1000})
-            communities = result.get('listAllCommunities', {}).get('items', [])
-            
-            # Check if any community has the same email
-            for community in communities:
-                if community.get('email', '').lower() == community_email.lower():
-                    community_id = community.get('id')
-                    if community_id:
-                        # Check if the corresponding group exists
-                        group_name = f"community-{community_id}"
-                        try:
-                            cognito_client.get_group(
-                                GroupName=group_name,
-                                UserPoolId=user_pool_id
-                            )
-                            return True, group_name
-                        except ClientError as e:
-                            error_code = e.response.get('Error', {}).get('Code', '')
-                            if error_code == 'ResourceNotFoundException':
-                                # Community exists but group doesn't - this is unusual but not a blocker
-                                pass
-                            else:
-                                # Other error - log but continue
-                                print(f"  ⚠ Warning: Error checking group '{group_name}': {error_code}")
+            community_id = _find_community_id_by_email(client, community_email)
+            if community_id:
+                # Check if the corresponding group exists
+                group_name = f"community-{community_id}"
+                try:
+                    cognito_client.get_group(
+                        GroupName=group_name,
+                        UserPoolId=user_pool_id
+                    )
+                    return True, group_name
+                except ClientError as e:
+                    error_code = e.response.get('Error', {}).get('Code', '')
+                    if error_code == 'ResourceNotFoundException':
+                        # Community exists but group doesn't - this is unusual but not a blocker
+                        pass
+                    else:
+                        # Other error - log but continue
+                        print(f"  ⚠ Warning: Error checking group '{group_name}': {error_code}")
         except Exception as e:
             # If GraphQL query fails, fall back to listing groups
             print(f"  ⚠ Warning: Could not query GraphQL for communities: {str(e)}")
@@ -687,17 +1146,26 @@ def check_community_group_exists(client: Client, cognito_client, user_pool_id: s
         try:
             response = cognito_client.list_groups(UserPoolId=user_pool_id)
             groups = response.get('Groups', [])
-            
-            # Check if any groups match the community pattern (community-*)
-            community_groups = [g for g in groups if g['GroupName'].startswith('community-')]
-            
-            if community_groups:
-                # Check group descriptions to see if any match this community email or name
-                for group in community_groups:
-                    description = group.get('Description', '')
-                    if (community_email.lower() in description.lower() or 
-                        community_name.lower() in description.lower()):
-                        return True, group['GroupName']
+
+            # Index the community-pattern groups by name once
+            by_name = {g['GroupName']: g for g in groups if g['GroupName'].startswith('community-')}
+
+            if by_name:
+                # With a known community id the canonical group name is an
+                # O(1) dict probe
+                if community_id and f"community-{community_id}" in by_name:
+                    return True, f"community-{community_id}"
+
+                # Otherwise fall back to the description scan: one compiled
+                # case-insensitive pass per description instead of two
+                # lowercased copies and two substring hunts
+                needle = re.compile(
+                    '|'.join(re.escape(s) for s in (community_email, community_name)),
+                    re.IGNORECASE,
+                )
+                for group_name, group in by_name.items():
+                    if needle.search(group.get('Description', '')):
+                        return True, group_name
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             error_message = e.response.get('Error', {}).get('Message', '')
@@ -715,45 +1183,39 @@ def check_community_group_exists(client: Client, cognito_client, user_pool_id: s
         return False, ""
 
 
-def check_users_exist_in_cognito(cognito_client, user_pool_id: str, emails: List[str]) -> Tuple[bool, List[str]]:
+def check_users_exist_in_cognito(cognito_client, user_pool_id: str, emails: List[str]) -> Tuple[bool, List[str], Optional[set]]:
     """
     Check if any of the provided emails already exist in Cognito User Pool
-    
+
     Args:
         cognito_client: boto3 Cognito client
         user_pool_id: Cognito User Pool ID
         emails: List of email addresses to check
-    
+
     Returns:
-        Tuple of (users_exist: bool, existing_emails: List[str])
+        Tuple of (users_exist: bool, existing_emails: List[str],
+        pool_emails: Optional[set]). pool_emails is the full lowercased
+        pool listing so later phases can reuse it instead of paging the
+        pool again; None when the listing failed.
     """
-    existing_emails = []
-    
-    for email in emails:
-        if not email:
-            continue
-        
-        try:
-            # Try to get the user by username (email)
-            cognito_client.admin_get_user(
-                UserPoolId=user_pool_id,
-                Username=email
-            )
-            # If no exception, user exists
-            existing_emails.append(email)
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', '')
-            if error_code == 'UserNotFoundException':
-                # User doesn't exist - this is fine
-                pass
-            else:
-                # Other error - log but don't fail the check
-                print(f"  ⚠ Warning: Error checking user '{email}' in Cognito: {error_code}")
-        except Exception as e:
-            # Unexpected error - log but don't fail the check
-            print(f"  ⚠ Warning: Unexpected error checking user '{email}' in Cognito: {str(e)}")
-    
-    return len(existing_emails) > 0, existing_emails
+    # One paginated listing of the pool replaces an admin_get_user round
+    # trip per email; membership then resolves against a local set
+    try:
+        pool_emails = prefetch_existing_users(cognito_client, user_pool_id)
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code', '')
+        # Error - log but don't fail the check
+        print(f"  ⚠ Warning: Error listing Cognito users: {error_code}")
+        return False, [], None
+    except Exception as e:
+        # Unexpected error - log but don't fail the check
+        print(f"  ⚠ Warning: Unexpected error listing Cognito users: {str(e)}")
+        return False, [], None
+
+    existing_emails = [email for email in emails
+                       if email and email.lower() in pool_emails]
+
+    return len(existing_emails) > 0, existing_emails, pool_emails
 
 
 def check_excel_already_processed(file_path: str) -> Tuple[bool, str]:
@@ -767,88 +1229,46 @@ def check_excel_already_processed(file_path: str) -> Tuple[bool, str]:
         Tuple of (is_processed: bool, reason: str)
     """
     try:
-        wb = openpyxl.load_workbook(file_path)
-        
-        # Check 1: Admin Credentials sheet exists
-        if 'Admin Credentials' in wb.sheetnames:
-            ws_admin = wb['Admin Credentials']
-            # Check if it has data (at least header and one data row)
-            if ws_admin.max_row >= 2:
-                admin_email = ws_admin.cell(row=2, column=1).value
-                if admin_email:
-                    return True, f"Admin Credentials sheet already exists with email: {admin_email}"
-        
-        # Check 2: CommunityId column exists and has values in Users sheet
-        if 'Users' in wb.sheetnames:
-            ws_users = wb['Users']
-            headers = [cell.value for cell in ws_users[1]]
-            
-            # Find CommunityId column
-            community_id_col_idx = None
-            for idx, header in enumerate(headers):
-                if header == 'CommunityId':
-                    community_id_col_idx = idx + 1
-                    break
-            
-            if community_id_col_idx:
-                # Check if any row has a CommunityId value
-                for row_idx in range(2, ws_users.max_row + 1):
-                    community_id_value = ws_users.cell(row=row_idx, column=community_id_col_idx).value
-                    if community_id_value:
-                        return True, f"CommunityId already exists in Users sheet: {community_id_value}"
-        
-        return False, ""
-        
-    except Exception as e:
-        # If we can't read the file, assume it's not processed (let other errors surface)
-        return False, f"Could not check file status: {str(e)}"
+        # read_only streams rows straight from the XML instead of
+        # inflating the whole workbook into cell objects; this check
+        # only ever looks at one cell and one column
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # Check 1: Admin Credentials sheet exists
+            if 'Admin Credentials' in wb.sheetnames:
+                ws_admin = wb['Admin Credentials']
+                # Check if it has data (at least header and one data row)
+                for row_idx, row in enumerate(ws_admin.iter_rows(min_row=1, max_row=2, values_only=True), 1):
+                    if row_idx == 2 and row and row[0]:
+                        return True, f"Admin Credentials sheet already exists with email: {row[0]}"
 
+            # Check 2: CommunityId column exists and has values in Users sheet
+            if 'Users' in wb.sheetnames:
+                ws_users = wb['Users']
+
+                community_id_idx = None
+                for row_num, row in enumerate(ws_users.iter_rows(values_only=True), 1):
+                    if row_num == 1:
+                        # Find CommunityId column from the header row
+                        if 'CommunityId' in row:
+                            community_id_idx = row.index('CommunityId')
+                        else:
+                            break
+                    # Check if any row has a CommunityId value (rows from
+                    # streamed sheets can stop short of the header width)
+                    elif community_id_idx < len(row) and row[community_id_idx]:
+                        return True, f"CommunityId already exists in Users sheet: {row[community_id_idx]}"
+
+            return False, ""
+        finally:
+            wb.close()
 
-def add_admin_credentials_to_excel(file_path: str, admin_email: str, admin_password: str) -> None:
-    """
-    Add a new sheet to the Excel file with admin username (email) and password
-    
-    Args:
-        file_path: Path to the Excel file
-        admin_email: Admin user email address
-        admin_password: Admin user password
-    """
-    try:
-        wb = openpyxl.load_workbook(file_path)
-        
-        # Remove existing Admin Credentials sheet if it exists
-        if 'Admin Credentials' in wb.sheetnames:
-            wb.remove(wb['Admin Credentials'])
-        
-        # Create new sheet
-        ws = wb.create_sheet('Admin Credentials')
-        
-        # Add headers
-        ws.cell(row=1, column=1, value='Username (Email)')
-        ws.cell(row=1, column=2, value='Password')
-        
-        # Add data
-        ws.cell(row=2, column=1, value=admin_email)
-        ws.cell(row=2, column=2, value=admin_password)
-        
-        # Make headers bold (optional formatting)
-        from openpyxl.styles import Font
-        bold_font = Font(bold=True)
-        ws.cell(row=1, column=1).font = bold_font
-        ws.cell(row=1, column=2).font = bold_font
-        
-        # Auto-adjust column widths
-        ws.column_dimensions['A'].width = max(len('Username (Email)'), len(admin_email)) + 2
-        ws.column_dimensions['B'].width = max(len('Password'), len(admin_password)) + 2
-        
-        wb.save(file_path)
-        print(f"  ✓ Added admin credentials to Excel file (sheet: 'Admin Credentials')")
     except Exception as e:
-        print(f"  ✗ Error adding admin credentials to Excel file: {str(e)}")
-        raise
+        # If we can't read the file, assume it's not processed (let other errors surface)
+        return False, f"Could not check file status: {str(e)}"
 
 
-def create_community(client: Client, community_data: Dict, verbose: bool = False) -> Optional[Dict]:
+def create_community(client: SyncClientSession, community_data: Dict, verbose: bool = False) -> Optional[Dict]:
     """
     Create a community using GraphQL mutation
     
@@ -860,27 +1280,8 @@ def create_community(client: Client, community_data: Dict, verbose: bool = False
     Returns:
         Created community data or None if failed
     """
-    mutation = gql("""
-        mutation CreateCommunity($input: CreateCommunityInput!) {
-            createCommunity(input: $input) {
-                id
-                name
-                street
-                city
-                state
-                country
-                postalCode
-                phoneNumber
-                email
-                residentLimit
-                caretakerLimit
-                isActive
-                createdAt
-                updatedAt
-            }
-        }
-    """)
-    
+    mutation = _CREATE_COMMUNITY_MUTATION
+
     if verbose:
         print(f"\n  [VERBOSE] GraphQL Mutation:")
         print(f"    Mutation: createCommunity")
@@ -897,7 +1298,7 @@ def create_community(client: Client, community_data: Dict, verbose: bool = False
     try:
         if verbose:
             print(f"  [VERBOSE] Executing mutation...")
-        result = client.execute(mutation, variable_values={'input': community_data})
+        result = _execute(client, mutation, {'input': community_data})
         
         if verbose:
             print(f"  [VERBOSE] Mutation result: {result}")
@@ -921,14 +1322,68 @@ def create_community(client: Client, community_data: Dict, verbose: bool = False
             if hasattr(e, 'response'):
                 print(f"    Response: {e.response}")
             print(f"    Input data that failed: {community_data}")
-            import traceback
             print(f"    Traceback:")
             traceback.print_exc()
         
         return None
 
 
-def verify_caretaker_created(client: Client, email: str) -> bool:
+def caretaker_exists(client: SyncClientSession, email: str, community_id: str) -> Optional[Dict]:
+    """
+    Probe whether a caretaker record already exists for a community
+
+    Args:
+        client: GraphQL client
+        email: Caretaker email address
+        community_id: Community ID the caretaker would belong to
+
+    Returns:
+        The existing caretaker record (id only), or None if absent or
+        the probe failed
+    """
+    try:
+        result = _execute(client, _CARETAKER_EXISTS_QUERY, {
+            'email': email,
+            'communityId': community_id,
+        })
+        response = result.get('caretakerExists') or {}
+        if response.get('exists'):
+            return response.get('caretaker') or {}
+        return None
+    except Exception as e:
+        print(f"  ⚠ Warning: Could not probe for existing caretaker: {str(e)}")
+        return None
+
+
+def wait_for_community_visible(client: SyncClientSession, community_id: str) -> bool:
+    """
+    Poll until a freshly created community is readable, with backoff
+
+    Replaces a fixed propagation sleep: reads usually succeed on the
+    first probe, so the median wait is one RTT instead of seconds,
+    while slow propagation still gets progressively longer retries.
+
+    Args:
+        client: GraphQL client
+        community_id: ID of the community to probe
+
+    Returns:
+        True once getCommunity returns the record, False if it never did
+    """
+    for delay in (0, 0.2, 0.4, 0.8, 1.6):
+        if delay:
+            time.sleep(delay)
+        try:
+            result = _execute(client, _GET_COMMUNITY_ID_QUERY, {'id': community_id})
+            if result.get('getCommunity'):
+                return True
+        except Exception:
+            # Treat transient read errors like not-yet-visible and retry
+            pass
+    return False
+
+
+def verify_caretaker_created(client: SyncClientSession, email: str) -> bool:
     """
     Verify that a caretaker was created correctly by querying getUserByEmail
     
@@ -939,22 +1394,8 @@ def verify_caretaker_created(client: Client, email: str) -> bool:
     Returns:
         True if caretaker is found, False otherwise
     """
-    query = gql("""
-        query GetUserByEmail($email: String!, $role: String!) {
-            getUserByEmail(email: $email, role: $role) {
-                id
-                email
-                firstName
-                lastName
-                communityId
-                role
-                isActive
-            }
-        }
-    """)
-    
     try:
-        result = client.execute(query, variable_values={
+        result = _execute(client, _GET_USER_BY_EMAIL_QUERY, {
             'email': email,
             'role': 'CARETAKER'
         })
@@ -965,7 +1406,7 @@ def verify_caretaker_created(client: Client, email: str) -> bool:
         return False
 
 
-def create_caretaker(client: Client, caretaker_data: Dict, verbose: bool = False) -> Optional[Dict]:
+def create_caretaker(client: SyncClientSession, caretaker_data: Dict, verbose: bool = False) -> Optional[Dict]:
     """
     Create a caretaker using GraphQL mutation
     
@@ -977,22 +1418,8 @@ def create_caretaker(client: Client, caretaker_data: Dict, verbose: bool = False
     Returns:
         Created caretaker data or None if failed
     """
-    mutation = gql("""
-        mutation CreateCommunityCaretaker($input: CreateCaretakerInput!) {
-            createCommunityCaretaker(input: $input) {
-                id
-                communityId
-                firstName
-                lastName
-                email
-                role
-                isActive
-                createdAt
-                updatedAt
-            }
-        }
-    """)
-    
+    mutation = _CREATE_COMMUNITY_CARETAKER_MUTATION
+
     if verbose:
         print(f"\n  [VERBOSE] GraphQL Mutation:")
         print(f"    Mutation: createCommunityCaretaker")
@@ -1008,7 +1435,7 @@ def create_caretaker(client: Client, caretaker_data: Dict, verbose: bool = False
     try:
         if verbose:
             print(f"  [VERBOSE] Executing mutation...")
-        result = client.execute(mutation, variable_values={'input': caretaker_data})
+        result = _execute(client, mutation, {'input': caretaker_data})
         
         if verbose:
             print(f"  [VERBOSE] Mutation result: {result}")
@@ -1032,17 +1459,151 @@ def create_caretaker(client: Client, caretaker_data: Dict, verbose: bool = False
             if hasattr(e, 'response'):
                 print(f"    Response: {e.response}")
             print(f"    Input data that failed: {caretaker_data}")
-            import traceback
             print(f"    Traceback:")
             traceback.print_exc()
         
         return None
 
 
+@lru_cache(maxsize=None)
+def build_batched_mutation(op_name: str, input_type: str, batch_size: int, selection: str):
+    """
+    Build a single GraphQL document that packs batch_size aliased mutations
+
+    Each record becomes an aliased field (m0, m1, ...) bound to its own
+    input variable (in0, in1, ...), so one HTTP round-trip carries the
+    whole batch. The parsed document is cached per (operation, batch size)
+    so the gql() parser runs once per unique shape.
+
+    Args:
+        op_name: GraphQL mutation field name (e.g. 'createCommunityCaretaker')
+        input_type: GraphQL input type name (e.g. 'CreateCaretakerInput')
+        batch_size: Number of records in the batch
+        selection: Selection set to request for each created record
+
+    Returns:
+        Parsed gql DocumentNode for the batched mutation
+    """
+    var_defs = ', '.join(f'$in{i}: {input_type}!' for i in range(batch_size))
+    fields = ' '.join(
+        f'm{i}: {op_name}(input: $in{i}) {{ {selection} }}'
+        for i in range(batch_size)
+    )
+    return gql(f'mutation BatchedCreate({var_defs}) {{ {fields} }}')
+
+
+@lru_cache(maxsize=None)
+def _batch_names(batch_size: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Precompute the variable and alias names for a given batch size
+
+    Packing variables and unpacking aliased results re-formatted the
+    'in{i}' / 'm{i}' names for every record of every batch; the name
+    tuples are now built once per unique batch size and reused, so the
+    hot path is a zip over precomputed strings.
+
+    Args:
+        batch_size: Number of records in the batch
+
+    Returns:
+        Tuple of (variable names, result alias names)
+    """
+    return (
+        tuple(f'in{i}' for i in range(batch_size)),
+        tuple(f'm{i}' for i in range(batch_size)),
+    )
+
+
+_CARETAKER_SELECTION = 'id communityId firstName lastName email role isActive createdAt updatedAt'
+
+
+def create_caretakers_batch(client: SyncClientSession, caretakers: List[Dict], verbose: bool = False) -> List[Optional[Dict]]:
+    """
+    Create caretakers in batches of aliased mutations (BATCH_SIZE per request)
+
+    Sending N records per HTTP request amortizes the TLS/auth/HTTP overhead
+    that a per-record loop pays on every round-trip. When individual
+    aliases in a batch error, the partial data for the committed siblings
+    is kept and only the failed records are retried; whole-chunk retry is
+    reserved for transport failures where no response came back.
+
+    Args:
+        client: GraphQL client
+        caretakers: List of caretaker data dictionaries
+        verbose: If True, print detailed debugging information
+
+    Returns:
+        List of created caretaker data (or None for failures), in input order
+    """
+    results: List[Optional[Dict]] = [None] * len(caretakers)
+
+    def run_batch(start: int) -> None:
+        chunk = caretakers[start:start + BATCH_SIZE]
+        mutation = build_batched_mutation(
+            'createCommunityCaretaker',
+            'CreateCaretakerInput',
+            len(chunk),
+            _CARETAKER_SELECTION,
+        )
+        var_names, aliases = _batch_names(len(chunk))
+        variables = dict(zip(var_names, chunk))
+
+        if verbose:
+            print(f"\n  [VERBOSE] Batched GraphQL Mutation:")
+            print(f"    Mutation: createCommunityCaretaker x{len(chunk)}")
+            print(f"    Records {start + 1}-{start + len(chunk)} of {len(caretakers)}")
+
+        try:
+            result = _execute(client, mutation, variables)
+            for i, alias in enumerate(aliases):
+                results[start + i] = result.get(alias)
+        except TransportQueryError as e:
+            # AppSync executes aliased root fields independently, so the
+            # sibling writes are already committed when one alias errors
+            # and the exception carries their partial data. Keep those
+            # and retry only the aliases that came back empty —
+            # re-running the whole chunk would duplicate the committed
+            # records.
+            partial = e.data or {}
+            print(f"  ⚠ Batched mutation partially failed ({str(e)}), retrying failed records individually...")
+            for i, (alias, caretaker) in enumerate(zip(aliases, chunk)):
+                created = partial.get(alias)
+                if created:
+                    results[start + i] = created
+                else:
+                    results[start + i] = create_caretaker(client, caretaker, verbose=verbose)
+        except Exception as e:
+            # Transport-level failure: no response data came back, so
+            # nothing in the chunk was confirmed and each record is
+            # retried individually.
+            print(f"  ⚠ Batched mutation failed ({str(e)}), retrying records individually...")
+            for i, caretaker in enumerate(chunk):
+                results[start + i] = create_caretaker(client, caretaker, verbose=verbose)
+
+    starts = range(0, len(caretakers), BATCH_SIZE)
+    if len(starts) <= 1:
+        for start in starts:
+            run_batch(start)
+    else:
+        # Submit batches concurrently: the workload is network-bound, so
+        # overlapping the round-trips scales wall-clock down nearly
+        # linearly up to the connection pool / AppSync concurrency limit.
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(starts))) as executor:
+            list(executor.map(run_batch, starts))
+
+    return results
+
+
+# All 41 possible states of the 40-slot progress bar, rendered once at
+# import; printing then just indexes the precomputed string
+_PROGRESS_BAR_LENGTH = 40
+_PROGRESS_BARS = ["█" * i + "░" * (_PROGRESS_BAR_LENGTH - i) for i in range(_PROGRESS_BAR_LENGTH + 1)]
+
+
 def print_progress_header(phase: str, step: int, total_steps: int, description: str = ""):
     """
     Print a progress header showing overall progress
-    
+
     Args:
         phase: Current phase name
         step: Current step number
@@ -1050,16 +1611,15 @@ def print_progress_header(phase: str, step: int, total_steps: int, description:
         description: Optional description
     """
     percentage = int((step / total_steps) * 100)
-    progress_bar_length = 40
-    filled = int((step / total_steps) * progress_bar_length)
-    bar = "█" * filled + "░" * (progress_bar_length - filled)
-    
-    print("\n" + "="*60)
+    filled = int((step / total_steps) * _PROGRESS_BAR_LENGTH)
+    bar = _PROGRESS_BARS[filled]
+
+    print("\n" + _SEP)
     print(f"OVERALL PROGRESS: [{bar}] {percentage}%")
     print(f"Phase {step}/{total_steps}: {phase}")
     if description:
         print(f"  {description}")
-    print("="*60)
+    print(_SEP)
 
 
 def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
@@ -1077,33 +1637,33 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
     TOTAL_STEPS = 4
     
     # Authenticate with Cognito User Pool to get JWT token for GraphQL
-    cognito_user_pool_id = os.getenv('COGNITO_USER_POOL_ID')
-    cognito_client_id = os.getenv('COGNITO_CLIENT_ID')
+    cognito_user_pool_id = get_config('COGNITO_USER_POOL_ID')
+    cognito_client_id = get_config('COGNITO_CLIENT_ID')
     
     if not cognito_user_pool_id:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: COGNITO_USER_POOL_ID is required")
-        print("="*60)
+        print(_SEP)
         print("Cognito User Pool ID is required for authentication and user registration.")
         print("Please set COGNITO_USER_POOL_ID in your env.local file.")
         sys.exit(1)
     
     if not cognito_client_id:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: COGNITO_CLIENT_ID is required")
-        print("="*60)
+        print(_SEP)
         print("Cognito App Client ID is required for authentication.")
         print("Please set COGNITO_CLIENT_ID in your env.local file.")
         print("You can find this in: Cognito Console → User Pools → Your Pool → App clients")
         sys.exit(1)
     
     # Prompt for username and password
-    print("="*60)
+    print(_SEP)
     print("Cognito Authentication Required")
-    print("="*60)
+    print(_SEP)
     print("Enter your credentials to authenticate with Cognito")
     print("(This is for GraphQL API access)")
-    print("="*60)
+    print(_SEP)
     username = input("Enter your username (email): ").strip()
     if not username:
         print("ERROR: Username cannot be empty")
@@ -1135,9 +1695,9 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
         cognito_client = create_cognito_client()
         print("  ✓ Cognito client initialized")
     except Exception as e:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Could not initialize Cognito client")
-        print("="*60)
+        print(_SEP)
         print(f"Error: {str(e)}")
         print("Cognito is required for user authentication. Cannot proceed.")
         sys.exit(1)
@@ -1150,9 +1710,9 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
     # Guard: Check if file has already been processed
     is_processed, reason = check_excel_already_processed(file_path)
     if is_processed:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Excel file has already been processed")
-        print("="*60)
+        print(_SEP)
         print(f"Reason: {reason}")
         print("\nThis file appears to have already been processed.")
         print("To prevent duplicate community/caretaker creation, processing is blocked.")
@@ -1162,40 +1722,31 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
         print("  3. Run the script again")
         sys.exit(1)
     
-    communities = read_community_data(file_path)
-    caretakers = read_caretaker_data(file_path)
+    workbook = RegistrationWorkbook(file_path)
+    communities = workbook.get_communities()
+    caretakers = workbook.get_caretakers()
     
+    # Shared normalized state for the rest of the run (emails, admin address)
+    context = RegistrationContext(communities, caretakers)
+
     # Guard: Check if users already exist in Cognito
     print("  Checking if users already exist in Cognito...")
-    emails_to_check = []
-    
-    # Collect caretaker emails
-    for caretaker in caretakers:
-        email = caretaker.get('email')
-        if email:
-            emails_to_check.append(email)
-    
-    # Generate and add community admin email
-    if communities:
-        community_name = communities[0].get('name', 'Community')
-        sanitized_name = ''.join(c.lower() if c.isalnum() else '' for c in community_name)
-        if not sanitized_name:
-            sanitized_name = 'community'
-        community_admin_email = f"{sanitized_name}@foresightcares.com"
-        emails_to_check.append(community_admin_email)
-    
-    # Check Cognito for existing users
+    emails_to_check = context.emails_to_check()
+
+    # Check Cognito for existing users; keep the pool listing the check
+    # fetched so the enrollment phase doesn't have to page the pool again
+    existing_cognito_users = None
     if emails_to_check:
-        users_exist, existing_emails = check_users_exist_in_cognito(
+        users_exist, existing_emails, existing_cognito_users = check_users_exist_in_cognito(
             cognito_client,
             cognito_user_pool_id,
             emails_to_check
         )
         
         if users_exist:
-            print("\n" + "="*60)
+            print("\n" + _SEP)
             print("ERROR: Users already exist in Cognito")
-            print("="*60)
+            print(_SEP)
             print("The following email(s) are already registered in Cognito:")
             for email in existing_emails:
                 print(f"  - {email}")
@@ -1223,9 +1774,9 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
             )
             
             if group_exists:
-                print("\n" + "="*60)
+                print("\n" + _SEP)
                 print("ERROR: Community group already exists in Cognito")
-                print("="*60)
+                print(_SEP)
                 print(f"Found existing group: {group_name}")
                 print(f"Community email: {community_email}")
                 print("\nThis indicates that a community with this email may have already been processed.")
@@ -1241,15 +1792,15 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
     
     # Validate that there is exactly one community
     if len(communities) == 0:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: No valid community found in Excel file")
-        print("="*60)
+        print(_SEP)
         print("The Excel file must contain exactly one community in the 'Community Info' sheet.")
         sys.exit(1)
     elif len(communities) > 1:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Multiple communities found in Excel file")
-        print("="*60)
+        print(_SEP)
         print(f"Found {len(communities)} communities:")
         for idx, comm in enumerate(communities, 1):
             print(f"  {idx}. {comm.get('name', 'Unknown')}")
@@ -1284,7 +1835,7 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
             print(f"    Full result: {result}")
         
         # Update Excel file with community ID
-        update_excel_with_community_id(file_path, community_id)
+        workbook.set_community_id(community_id, verbose=verbose)
         
         # Create/get Cognito group for this community (REQUIRED)
         try:
@@ -1296,122 +1847,149 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
             )
         except Exception as e:
             print(f"  ✗ Failed to create/get Cognito group")
-            print("\n" + "="*60)
+            print("\n" + _SEP)
             print("ERROR: Cognito group creation failed")
-            print("="*60)
+            print(_SEP)
             print(f"Error: {str(e)}")
             print("Cognito group is required for user authentication. Cannot proceed.")
             sys.exit(1)
         
-        # Wait for DynamoDB to propagate changes
+        # Wait for DynamoDB to propagate changes by polling the actual
+        # readiness signal instead of sleeping a fixed 3 seconds
         print(f"\n  Waiting for DynamoDB to propagate changes...")
-        wait_seconds = 3
-        for i in range(wait_seconds, 0, -1):
-            print(f"  Waiting {i} second(s)...", end='\r')
-            time.sleep(1)
-        print(f"  ✓ Ready to create caretakers")
+        if wait_for_community_visible(client, community_id):
+            print(f"  ✓ Ready to create caretakers")
+        else:
+            print(f"  ⚠ Warning: Community not yet readable after polling; continuing anyway")
     else:
         print(f"  ✗ Failed to create")
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Failed to create community. Cannot proceed with caretaker creation.")
-        print("="*60)
+        print(_SEP)
         sys.exit(1)
     
     # Step 3: Create caretakers
     print_progress_header("Creating Caretakers", 3, TOTAL_STEPS, f"Creating {len(caretakers)} caretaker(s)...")
     
     created_caretakers = []
-    
-    for idx, caretaker_data in enumerate(caretakers, 1):
-        # Show progress within caretaker creation phase
-        caretaker_progress = int((idx / len(caretakers)) * 100) if len(caretakers) > 0 else 0
-        print(f"\n[{idx}/{len(caretakers)}] ({caretaker_progress}%) Creating caretaker: {caretaker_data.get('firstName')} {caretaker_data.get('lastName')}")
-        
-        # Always use the newly created community ID (overwrite any existing value from Excel)
+    cognito_enrollments = []  # (caretaker_data, email) pairs pending Cognito registration
+
+    # Always use the newly created community ID (overwrite any existing value from Excel)
+    for caretaker_data in caretakers:
         old_community_id = caretaker_data.get('communityId')
         caretaker_data['communityId'] = community_id
-        
+
         if old_community_id and old_community_id != community_id:
             print(f"  ⚠ Overwriting existing communityId '{old_community_id}' with newly created '{community_id}'")
-        
-        if verbose:
-            print(f"\n  [VERBOSE] Before creating caretaker:")
-            print(f"    Caretaker data (before): {caretaker_data}")
-            if old_community_id and old_community_id != community_id:
-                print(f"    ⚠ WARNING: Overwriting existing communityId '{old_community_id}' with newly created '{community_id}'")
-            print(f"    Community ID from variable: {community_id}")
-            print(f"    Community ID in caretaker_data (after update): {caretaker_data.get('communityId')}")
-            print(f"    Types: community_id={type(community_id)}, caretaker_data['communityId']={type(caretaker_data.get('communityId'))}")
-        
-        result = create_caretaker(client, caretaker_data, verbose=verbose)
-        
+
+    # Create all caretakers up front via batched aliased mutations
+    if caretakers:
+        print(f"\nCreating {len(caretakers)} caretaker(s) in batches of up to {BATCH_SIZE} per request...")
+    batch_results = create_caretakers_batch(client, caretakers, verbose=verbose)
+
+    for idx, (caretaker_data, result) in enumerate(zip(caretakers, batch_results), 1):
+        # Read each field once per row instead of repeating the dict
+        # lookups in every print below
+        first_name = caretaker_data.get('firstName', '')
+        last_name = caretaker_data.get('lastName', '')
+        caretaker_email = caretaker_data.get('email')
+
+        # Show progress within caretaker creation phase
+        caretaker_progress = int((idx / len(caretakers)) * 100) if len(caretakers) > 0 else 0
+        print(f"\n[{idx}/{len(caretakers)}] ({caretaker_progress}%) Caretaker: {first_name} {last_name}")
+
         if result:
             created_caretakers.append(result)
-            print(f"  ✓ Successfully created with ID: {result['id']}")
-            
-            # Verify caretaker was created correctly (round-trip check)
-            caretaker_email = caretaker_data.get('email')
+            print(f"  ✓ Successfully created with ID: {result.get('id')}")
             if not caretaker_email:
                 print(f"  ✗ Cannot proceed: email not found in caretaker data")
-                print("\n" + "="*60)
-                print("ERROR: Email is required for verification and Cognito registration")
-                print("="*60)
+                print("\n" + _SEP)
+                print("ERROR: Email is required for Cognito registration")
+                print(_SEP)
                 sys.exit(1)
-            
-            print(f"  Verifying caretaker creation...")
-            is_verified = verify_caretaker_created(client, caretaker_email)
-            if is_verified:
-                print(f"  ✓ Verification successful: Caretaker found in system")
-            else:
-                print(f"  ⚠ ALARM: Verification failed! Caretaker '{caretaker_data.get('firstName')} {caretaker_data.get('lastName')}' (email: {caretaker_email}) was not found after creation.")
-                print(f"  ⚠ The caretaker may not have been created correctly. Please verify manually.")
-            
-            # Add user to Cognito and assign to group (REQUIRED)
+
+            # The mutation response already echoes the created record;
+            # an id there is the server confirming the write, so the
+            # getUserByEmail round trip per caretaker is only spent
+            # when the response looks incomplete
+            if not result.get('id'):
+                print(f"  Verifying caretaker creation...")
+                is_verified = verify_caretaker_created(client, caretaker_email)
+                if is_verified:
+                    print(f"  ✓ Verification successful: Caretaker found in system")
+                else:
+                    print(f"  ⚠ ALARM: Verification failed! Caretaker '{first_name} {last_name}' (email: {caretaker_email}) was not found after creation.")
+                    print(f"  ⚠ The caretaker may not have been created correctly. Please verify manually.")
+
+            # Queue user for Cognito registration (REQUIRED, done concurrently below)
             if not cognito_group_name:
                 print(f"  ✗ Cannot add to Cognito: group name not set")
-                print("\n" + "="*60)
+                print("\n" + _SEP)
                 print("ERROR: Cognito group name is required")
-                print("="*60)
+                print(_SEP)
                 sys.exit(1)
-            
-            print(f"  Adding user to Cognito...")
-            print(f"    User Pool ID: {cognito_user_pool_id}")
-            print(f"    Group: {cognito_group_name}")
-            first_name = caretaker_data.get('firstName', '')
-            last_name = caretaker_data.get('lastName', '')
-            
+
+            cognito_enrollments.append((caretaker_data, caretaker_email))
+        else:
+            print(f"  ✗ Failed to create")
+
+    # Register all created caretakers in Cognito concurrently. Each
+    # registration is at least two independent Cognito round trips, so
+    # fanning out over threads turns N·RTT of wall time into roughly
+    # ceil(N / workers)·RTT; the cached client's connection pool and
+    # adaptive retry config are sized for this fan-out.
+    if cognito_enrollments:
+        print(f"\nRegistering {len(cognito_enrollments)} user(s) in Cognito...")
+        print(f"  User Pool ID: {cognito_user_pool_id}")
+        print(f"  Group: {cognito_group_name}")
+
+        # The duplicate-user guard already paged the whole pool, and
+        # nothing this process does between there and here can add the
+        # caretaker emails to it, so its listing
+        # (existing_cognito_users) is reused as-is. When that listing
+        # failed it is None and the workers fall back to the
+        # create-then-catch-UsernameExistsException path.
+
+        def enroll_in_cognito(entry):
+            caretaker_data, email = entry
             try:
-                cognito_success = add_user_to_cognito(
+                success = add_user_to_cognito(
                     cognito_client,
                     cognito_user_pool_id,
-                    caretaker_email,
-                    first_name,
-                    last_name,
-                    cognito_group_name
+                    email,
+                    caretaker_data.get('firstName', ''),
+                    caretaker_data.get('lastName', ''),
+                    cognito_group_name,
+                    existing_users=existing_cognito_users
                 )
-                
-                if not cognito_success:
-                    print(f"  ✗ Failed to add user to Cognito")
-                    print("\n" + "="*60)
-                    print("ERROR: Cognito user registration failed")
-                    print("="*60)
-                    print(f"User '{caretaker_data.get('firstName')} {caretaker_data.get('lastName')}' (email: {caretaker_email})")
-                    print("was created in GraphQL but failed to register in Cognito.")
-                    print("User authentication will not work. Cannot proceed.")
-                    sys.exit(1)
+                return caretaker_data, email, success, None
             except Exception as e:
-                print(f"  ✗ Exception while adding user to Cognito: {str(e)}")
-                print("\n" + "="*60)
-                print("ERROR: Cognito user registration failed")
-                print("="*60)
-                print(f"User '{caretaker_data.get('firstName')} {caretaker_data.get('lastName')}' (email: {caretaker_email})")
-                print("was created in GraphQL but failed to register in Cognito.")
-                print(f"Error: {str(e)}")
-                print("User authentication will not work. Cannot proceed.")
-                sys.exit(1)
+                return caretaker_data, email, False, e
+
+        workers = min(MAX_WORKERS, len(cognito_enrollments))
+        if workers == 1:
+            enrollment_results = [enroll_in_cognito(cognito_enrollments[0])]
         else:
-            print(f"  ✗ Failed to create")
-    
+            # Resolve credentials on the main thread before fanning out
+            _warm_aws_credentials()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                enrollment_results = list(executor.map(enroll_in_cognito, cognito_enrollments))
+
+        failed_enrollments = [(c, email, error) for c, email, success, error in enrollment_results if not success]
+        if failed_enrollments:
+            print("\n" + _SEP)
+            print("ERROR: Cognito user registration failed")
+            print(_SEP)
+            for caretaker_data, email, error in failed_enrollments:
+                print(f"User '{caretaker_data.get('firstName')} {caretaker_data.get('lastName')}' (email: {email})")
+                if error:
+                    print(f"  Error: {str(error)}")
+            print("These users were created in GraphQL but failed to register in Cognito.")
+            print("User authentication will not work. Cannot proceed.")
+            sys.exit(1)
+
+        print(f"  ✓ All {len(cognito_enrollments)} user(s) registered in Cognito")
+
     # Step 4: Create community admin user with verified email
     print_progress_header("Creating Community Admin User", 4, TOTAL_STEPS, "Setting up community admin account...")
     
@@ -1419,27 +1997,23 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
     print("\nPlease enter the default password for the community admin user:")
     default_password = getpass.getpass("Password: ")
     if not default_password:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Password cannot be empty")
-        print("="*60)
+        print(_SEP)
         sys.exit(1)
     
     # Confirm password
     password_confirm = getpass.getpass("Confirm password: ")
     if default_password != password_confirm:
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Passwords do not match")
-        print("="*60)
+        print(_SEP)
         sys.exit(1)
     
-    # Sanitize community name for email (remove spaces, special chars, convert to lowercase)
-    community_name = community_data.get('name', 'Community')
-    sanitized_name = ''.join(c.lower() if c.isalnum() else '' for c in community_name)
-    if not sanitized_name:
-        sanitized_name = 'community'  # Fallback if name has no alphanumeric chars
-    
-    # Create email in format: CommunityName@foresightcares.com
-    community_email = f"{sanitized_name}@foresightcares.com"
+    # Admin email was derived once in the registration context
+    # (sanitized community name @foresightcares.com)
+    community_name = context.community_name
+    community_email = context.community_admin_email
     
     print(f"\nCreating community admin user:")
     print(f"  Email: {community_email}")
@@ -1447,9 +2021,9 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
     
     if not cognito_group_name:
         print(f"  ✗ Cannot add to Cognito: group name not set")
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Cognito group name is required")
-        print("="*60)
+        print(_SEP)
         sys.exit(1)
     
     try:
@@ -1465,63 +2039,71 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
         
         if not cognito_success:
             print(f"  ✗ Failed to create community admin user in Cognito")
-            print("\n" + "="*60)
+            print("\n" + _SEP)
             print("ERROR: Community admin user creation failed")
-            print("="*60)
+            print(_SEP)
             print(f"Email: {community_email}")
             print("User authentication will not work. Cannot proceed.")
             sys.exit(1)
         
         print(f"  ✓ Community admin user created successfully in Cognito")
         
-        # Create caretaker record in GraphQL for admin user
-        print(f"  Creating caretaker record for admin user...")
-        admin_caretaker_data = {
-            'firstName': community_name,
-            'lastName': 'Admin',
-            'email': community_email,
-            'communityId': community_id
-        }
-        
-        if verbose:
-            print(f"\n  [VERBOSE] Admin Caretaker Data:")
-            print(f"    {admin_caretaker_data}")
-        
-        admin_caretaker_result = create_caretaker(client, admin_caretaker_data, verbose=verbose)
-        
-        if admin_caretaker_result:
-            print(f"  ✓ Admin caretaker record created successfully with ID: {admin_caretaker_result['id']}")
-            
-            # Verify admin caretaker was created correctly
-            print(f"  Verifying admin caretaker creation...")
-            is_verified = verify_caretaker_created(client, community_email)
-            if is_verified:
-                print(f"  ✓ Verification successful: Admin caretaker found in system")
-            else:
-                print(f"  ⚠ ALARM: Verification failed! Admin caretaker (email: {community_email}) was not found after creation.")
-                print(f"  ⚠ The admin caretaker may not have been created correctly. Please verify manually.")
+        # Create caretaker record in GraphQL for admin user, unless a
+        # re-run already left one in place (one cheap probe instead of
+        # a doomed create)
+        existing_admin = caretaker_exists(client, community_email, community_id)
+        if existing_admin is not None:
+            print(f"  ✓ Admin caretaker record already exists with ID: {existing_admin.get('id')}")
         else:
-            print(f"  ✗ Failed to create admin caretaker record")
-            print("\n" + "="*60)
-            print("ERROR: Admin caretaker creation failed")
-            print("="*60)
-            print(f"Email: {community_email}")
-            print("The admin user was created in Cognito but failed to create caretaker record in GraphQL.")
-            print("Cannot proceed.")
-            sys.exit(1)
+            print(f"  Creating caretaker record for admin user...")
+            admin_caretaker_data = {
+                'firstName': community_name,
+                'lastName': 'Admin',
+                'email': community_email,
+                'communityId': community_id
+            }
+
+            if verbose:
+                print(f"\n  [VERBOSE] Admin Caretaker Data:")
+                print(f"    {admin_caretaker_data}")
+
+            admin_caretaker_result = create_caretaker(client, admin_caretaker_data, verbose=verbose)
+
+            if admin_caretaker_result:
+                print(f"  ✓ Admin caretaker record created successfully with ID: {admin_caretaker_result.get('id')}")
+
+                # The mutation response echoing an id confirms the write;
+                # only fall back to the round-trip check without one
+                if not admin_caretaker_result.get('id'):
+                    print(f"  Verifying admin caretaker creation...")
+                    is_verified = verify_caretaker_created(client, community_email)
+                    if is_verified:
+                        print(f"  ✓ Verification successful: Admin caretaker found in system")
+                    else:
+                        print(f"  ⚠ ALARM: Verification failed! Admin caretaker (email: {community_email}) was not found after creation.")
+                        print(f"  ⚠ The admin caretaker may not have been created correctly. Please verify manually.")
+            else:
+                print(f"  ✗ Failed to create admin caretaker record")
+                print("\n" + _SEP)
+                print("ERROR: Admin caretaker creation failed")
+                print(_SEP)
+                print(f"Email: {community_email}")
+                print("The admin user was created in Cognito but failed to create caretaker record in GraphQL.")
+                print("Cannot proceed.")
+                sys.exit(1)
         
         # Add admin credentials to Excel file
         try:
-            add_admin_credentials_to_excel(file_path, community_email, default_password)
+            workbook.add_admin_credentials(community_email, default_password)
         except Exception as e:
             print(f"  ⚠ Warning: Could not add admin credentials to Excel file: {str(e)}")
             # Don't exit - this is not critical for the main process
         
     except Exception as e:
         print(f"  ✗ Exception while creating community admin user: {str(e)}")
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("ERROR: Community admin user creation failed")
-        print("="*60)
+        print(_SEP)
         print(f"Email: {community_email}")
         print(f"Error: {str(e)}")
         print("User authentication will not work. Cannot proceed.")
@@ -1542,14 +2124,14 @@ def process_excel_file(file_path: str, verbose: bool = False) -> Dict:
             'data': created_caretakers
         }
     }
-    
+
+    workbook.close()
+
     return summary
 
 
 def main():
     """Main function to process registration"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Process Community Registration Excel file')
     parser.add_argument('file', help='Path to Excel file')
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -1563,21 +2145,21 @@ def main():
         print(f"Error: File '{args.file}' not found")
         return
     
-    print("="*60)
+    print(_SEP)
     print("Community Registration Processor")
-    print("="*60)
+    print(_SEP)
     print(f"File: {args.file}")
-    print(f"API URL: {os.getenv('APPSYNC_API_URL')}")
-    print(f"Region: {os.getenv('AWS_REGION', 'us-east-1')}")
-    print("="*60)
+    print(f"API URL: {get_config('APPSYNC_API_URL')}")
+    print(f"Region: {get_config('AWS_REGION', 'us-east-1')}")
+    print(_SEP)
     
     try:
         summary = process_excel_file(args.file, verbose=verbose)
         
         # Print summary
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("SUMMARY")
-        print("="*60)
+        print(_SEP)
         print(f"\nCommunities:")
         print(f"  Total: {summary['communities']['total']}")
         print(f"  Created: {summary['communities']['created']}")
@@ -1588,13 +2170,12 @@ def main():
         print(f"  Created: {summary['caretakers']['created']}")
         print(f"  Failed: {summary['caretakers']['failed']}")
         
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("Processing complete!")
-        print("="*60)
+        print(_SEP)
         
     except Exception as e:
         print(f"\nError processing file: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 